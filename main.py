@@ -1,7 +1,12 @@
-from dataclasses import dataclass, asdict
+from __future__ import annotations
+
+from dataclasses import dataclass, field
 from enum import Enum
 from abc import ABC, abstractmethod
-from typing import Callable
+from bisect import bisect_right
+from functools import lru_cache, wraps
+from sys import intern
+from typing import Callable, Sequence
 
 
 class Generos(Enum):
@@ -34,92 +39,66 @@ Edad = int | None
 Formula = str | None
 DictCalculoPesoIdeal = dict[str, float | int | str]
 DictCalculoCalorias = dict[str, float | int | str]
+DictInformeImc = dict[str, float | str]
 
+# las fórmulas comparan el genero contra esta constante en lugar de resolver el miembro del Enum en cada llamada
+_GENERO_MUJER: str = intern(Generos.MUJER.value)
 
-class Calculadora(ABC):
-    @abstractmethod
-    def get_data_persona(self) -> dict:
-        pass
-
-    @abstractmethod
-    def buscar_formula(self) -> Callable:
-        pass
-
-    @abstractmethod
-    def calcular(self) -> str | float:
-        pass
-
-
-@dataclass
-class Persona:
-    """Define los datos de la persona que
-    posteriormente se usaran para los cálculos
-    """
-    _nombre: str
-    _genero: str
-    _peso: int | float
-    _estatura: int | float
-    _edad: int
-
-    def __post_init__(self):
-        if not isinstance(self.nombre, str) or len(self.nombre) < 5:
-            raise ValueError("Debes colocar una cadena de texto y asegurate de colocar 5 o mas caracteres")
+_TIPOS_NUMERICOS: frozenset[type] = frozenset((int, float))
 
-        validar_data_persona(genero=self.genero, peso=self.peso,
-                             estatura=self.estatura, edad=self.edad)
+_GENEROS_VALIDOS: frozenset[str] = frozenset(genero.value for genero in Generos)
+_FORMULAS_KCAL_VALIDAS: frozenset[str] = frozenset(fo.value for fo in FormulasCalculoKcal)
+_FORMULAS_PESO_IDEAL_VALIDAS: frozenset[str] = frozenset(fo.value for fo in FormulasPesoIdeal)
 
-        self.genero = self.genero.lower()
+# límites del IMC de cada diagnóstico, un IMC igual al límite pertenece al diagnóstico siguiente
+_LIMITES_IMC: tuple[float, ...] = (18.5, 25.0, 30.0, 35.0)
+_MENSAJES_DIAGNOSTICO_IMC: tuple[str, ...] = (
+    "Te encuentras en un bajo peso",
+    "Te encuentras en un peso saludable",
+    "Te encuentras en sobrepeso",
+    "Te encuentras en obesidad",
+    "No te encuentras en ninguno de los resultados, verifica bien los datos que ingresados",
+)
 
-    @property
-    def nombre(self):
-        return self.nombre
+_MENSAJE_ERROR_NUMERO: str = "Debes colocar solo números y asegurate de estar ingresando un numero positivo"
 
-    @property
-    def genero(self):
-        return self.genero
+_MENSAJE_ERROR_GENERO: str = f"Debes colocar una opción valida, ademas asegurate de estar ingresando una cadena de texto: {tuple(genero.value for genero in Generos)}, error en la propiedad de 'genero'"
 
-    @property
-    def peso(self):
-        return self.peso
+_MENSAJE_ERROR_FORMULA_KCAL: str = f"Debes colocar una fórmula valida como las que se muestran a continuación: {tuple(fo.value for fo in FormulasCalculoKcal)}."
 
-    @property
-    def estatura(self):
-        return self.estatura
+# krumdieck solo usa peso y estatura, por eso no tiene versión para los datos completos de una persona
+_MENSAJE_ERROR_FORMULA_KCAL_PERSONA: str = f"Esta fórmula no se puede usar para calcular las kcal de una persona, usa una de las siguientes: {tuple(fo.value for fo in FormulasCalculoKcal if fo is not FormulasCalculoKcal.KRUMDIECK)}."
 
-    @property
-    def edad(self):
-        return self.edad
+_MENSAJE_ERROR_FORMULA_PESO_IDEAL: str = f"Debes colocar una fórmula valida como las que se muestran a continuación: {tuple(fo.value for fo in FormulasPesoIdeal)}"
 
-    @nombre.setter
-    def nombre(self, new_value: str):
-        self.nombre = new_value
 
-    @genero.setter
-    def genero(self, new_value: str):
-        validar_data_persona(genero=new_value)
-        self.genero = new_value
+class Calculadora(ABC):
+    __slots__ = ()
 
-    @peso.setter
-    def peso(self, new_value: int | float):
-        self.peso = new_value
+    @abstractmethod
+    def get_data_persona(self) -> dict:
+        pass
 
-    @estatura.setter
-    def estatura(self, new_value: int | float):
-        self.estatura = new_value
+    @abstractmethod
+    def buscar_formula(self) -> Callable:
+        pass
 
-    @edad.setter
-    def edad(self, new_value: int):
-        self.edad = new_value
+    @abstractmethod
+    def calcular(self) -> float:
+        pass
 
 
 # decorador
 def validar_data(func):
-    """Decorador encargado de validar los datos de la persona
+    """Decorador encargado de validar los datos de la persona,
+    se revisan tanto los argumentos por posición como por nombre
     """
 
+    @wraps(func)
     def wrapper(*args, **kwargs):
-        if any(not isinstance(arg, (int, float)) for arg in args):
-            raise ValueError("Solo numeros")
+        for arg in ((*args, *kwargs.values()) if kwargs else args):
+            if type(arg) not in _TIPOS_NUMERICOS:
+                raise ValueError("Solo numeros")
 
         return func(*args, **kwargs)
 
@@ -131,63 +110,57 @@ def validar_data_persona(genero: Genero = None,
                          estatura: Estatura = None,
                          edad: Edad = None,
                          ) -> None:
-    """Encargada de validar la información de la persona.
+    """Encargada de validar la información de la persona, el genero
+    debe llegar ya en minúsculas.
     """
+    if (genero is not None and not isinstance(genero, str)) or (genero is not None and genero not in _GENEROS_VALIDOS):
+        raise ValueError(_MENSAJE_ERROR_GENERO)
 
-    generos_validos: tuple[str] = tuple(genero.value for genero in Generos)
-
-    mensaje_error_numero: str = "Debes colocar solo números y asegurate de estar ingresando un numero positivo"
-
-    errores: dict[str, str] = {
-        "genero": f"Debes colocar una opción valida, ademas asegurate de estar ingresando una cadena de texto: {generos_validos}, error en la propiedad de 'genero'",
-        "peso": mensaje_error_numero,
-        "estatura": mensaje_error_numero,
-        "edad": mensaje_error_numero,
-    }
-
-    genero = genero.lower() if isinstance(genero, str) else genero
+    # type() en lugar de isinstance para que los bool (subclase de int) no pasen la validación
+    if peso is not None and ((type(peso) is not int and type(peso) is not float) or peso <= 0):
+        raise ValueError(f"{_MENSAJE_ERROR_NUMERO}, error en la propiedad de 'peso'")
 
-    if (genero is not None and genero not in generos_validos) or (genero is not None and not isinstance(genero, str)):
-        raise ValueError(errores.get("genero"))
+    if estatura is not None and ((type(estatura) is not int and type(estatura) is not float) or estatura <= 0):
+        raise ValueError(f"{_MENSAJE_ERROR_NUMERO}, error en la propiedad de 'estatura'")
 
-    for (name_error, value) in [("peso", peso), ("estatura", estatura),
-                                ("edad", edad)]:
-        if (isinstance(value, bool)
-                or (value is not None)
-                and (not isinstance(value, (int, float)))
-                or (value is not None) and (value <= 0)):
-            raise ValueError(f"{errores.get(name_error)}, error en la propiedad de '{name_error}'")
+    if edad is not None and ((type(edad) is not int and type(edad) is not float) or edad <= 0):
+        raise ValueError(f"{_MENSAJE_ERROR_NUMERO}, error en la propiedad de 'edad'")
 
 
 def validar_formula_kcal(formula: str | FormulasCalculoKcal, eta: bool) -> None:
-    """Encargada de validar la fórmula elegida por el usuario
+    """Encargada de validar la fórmula elegida por el usuario,
+    la fórmula debe llegar ya en minúsculas
     """
-    formulas_validas_kcal: tuple[str] = tuple(fo.value for fo in FormulasCalculoKcal)
-
-    formula: str = formula.lower() if isinstance(formula, str) else formula
-
     if not isinstance(eta, bool):
         raise ValueError("El valor de 'ETA' debe ser True o False")
 
     if not isinstance(formula, (str, FormulasCalculoKcal)):
         raise ValueError("Debes colocar una cadena de texto o un miembro del Enum FormulasCalculoKcal")
 
-    if isinstance(formula, str) and formula not in formulas_validas_kcal:
-        raise ValueError(
-            f"Debes colocar una fórmula valida como las que se muestran a continuación: {formulas_validas_kcal}.")
+    if isinstance(formula, str) and formula not in _FORMULAS_KCAL_VALIDAS:
+        raise ValueError(_MENSAJE_ERROR_FORMULA_KCAL)
 
 
-def validar_formula_peso_ideal(formula: str | FormulasPesoIdeal):
-    formulas_validas_peso_ideal: tuple[str] = tuple(fo.value for fo in FormulasPesoIdeal)
+def _normalizar_formula_kcal(formula: str | FormulasCalculoKcal, eta: bool) -> str:
+    """Encargada de llevar la fórmula al valor en minúsculas del Enum
+    y validarla, es el único lugar donde se normaliza la fórmula de kcal
+    """
+    if isinstance(formula, FormulasCalculoKcal):
+        formula = formula.value
+    elif isinstance(formula, str):
+        formula = formula.lower()
+
+    validar_formula_kcal(formula=formula, eta=eta)
+
+    return formula
 
-    formula = formula.lower() if isinstance(formula, str) else formula
 
+def validar_formula_peso_ideal(formula: str | FormulasPesoIdeal):
     if not isinstance(formula, (str, FormulasPesoIdeal)):
         raise ValueError("Debes colocar una cadena de texto o un miembro del enum FormulasPesoIdeal")
 
-    if isinstance(formula, str) and formula not in formulas_validas_peso_ideal:
-        raise ValueError(
-            f"Debes colocar una fórmula valida como las que se muestran a continuación: {formulas_validas_peso_ideal}")
+    if isinstance(formula, str) and formula not in _FORMULAS_PESO_IDEAL_VALIDAS:
+        raise ValueError(_MENSAJE_ERROR_FORMULA_PESO_IDEAL)
 
 
 def calcular_imc(peso: int | float, estatura: float | int) -> float:
@@ -195,9 +168,23 @@ def calcular_imc(peso: int | float, estatura: float | int) -> float:
     """
     validar_data_persona(peso=peso, estatura=estatura)
 
+    return _calcular_imc(peso, estatura)
+
+
+@lru_cache(maxsize=1024)
+def _calcular_imc(peso: int | float, estatura: float | int) -> float:
+    """Cálculo del IMC sin validación, se guarda en caché porque los
+    mismos datos se consultan varias veces (IMC, diagnóstico y rango saludable)
+    """
     estatura: float = convertir_cm_a_metros(estatura=estatura)
 
-    return round(peso / (estatura ** 2), ndigits=2)
+    return round(peso / (estatura * estatura), 2)
+
+
+def _diagnostico_imc(imc: float) -> str:
+    """Devuelve el mensaje de diagnóstico que corresponde al IMC
+    """
+    return _MENSAJES_DIAGNOSTICO_IMC[bisect_right(_LIMITES_IMC, imc)]
 
 
 def peso_ideal_lorentz(genero: str, estatura: int | float,
@@ -205,9 +192,13 @@ def peso_ideal_lorentz(genero: str, estatura: int | float,
     """Encargada de calcular el peso ideal según la fórmula de Lorentz
     y por defecto devuelve el genero de hombre
     """
-    estatura: float = convertir_metros_a_cm(estatura=estatura)
+    return _peso_ideal_lorentz(genero, convertir_metros_a_cm(estatura=estatura), edad)
+
 
-    if genero == Generos.MUJER.value:
+def _peso_ideal_lorentz(genero: str, estatura: float, edad: int) -> float:
+    """Núcleo de la fórmula de Lorentz, recibe la estatura en cm
+    """
+    if genero == _GENERO_MUJER:
         return round(estatura - 100 - ((estatura - 150) / 4) + ((edad - 20) / (2 ** 5)), ndigits=2)
 
     return round(estatura - 100 - ((estatura - 150) / 4) + ((edad - 20) / 4), ndigits=2)
@@ -216,64 +207,117 @@ def peso_ideal_lorentz(genero: str, estatura: int | float,
 def peso_ideal_perrault(estatura: int | float, edad: int) -> float:
     """Encargada de cálcular el peso ideal en base a la fórmula de perrault
     """
-    estatura: float = convertir_metros_a_cm(estatura=estatura)
+    return _peso_ideal_perrault(convertir_metros_a_cm(estatura=estatura), edad)
 
-    return float(estatura - 100 + (edad / 10) * (9 / 10))
+
+def _peso_ideal_perrault(estatura: float, edad: int) -> float:
+    """Núcleo de la fórmula de perrault, recibe la estatura en cm
+    """
+    return estatura - 100.0 + (edad / 10) * (9 / 10)
 
 
 def brocca_peso_ideal(estatura: int | float) -> float:
     """Encargada de cálcular el peso ideal de la
     persona mediante la fórmula de brocca
     """
-    estatura: float = convertir_metros_a_cm(estatura=estatura)
+    return _brocca_peso_ideal(convertir_metros_a_cm(estatura=estatura))
+
 
-    return float(estatura - 100)
+def _brocca_peso_ideal(estatura: float) -> float:
+    """Núcleo de la fórmula de brocca, recibe la estatura en cm
+    """
+    return estatura - 100.0
 
 
+# typed=True porque 1 y 1.0 se interpretan como unidades distintas de estatura
+@lru_cache(maxsize=1024, typed=True)
 def rango_peso_saludable(estatura: int | float) -> str:
     """Encargada de cálcular el rango de peso saludable
     de la persona en base al IMC por lo que no se puede
     tomar como una medida definitiva pero resulta útil
     como referencia.
     """
-    estatura: float = estatura ** 2 if isinstance(estatura, float) and estatura < 10 else (estatura / 100) ** 2
-
-    peso_maximo: float = round(estatura * 24.99, ndigits=2)
+    estatura: float = convertir_metros_a_cm(estatura=estatura) / 100
 
-    peso_minimo: float = round(estatura * 18.5, ndigits=2)
+    peso_minimo, peso_maximo = _limites_peso_saludable(estatura_cuadrado=estatura * estatura)
 
     return f"peso minimo={peso_minimo}kg - maximo={peso_maximo}kg"
 
 
+def _limites_peso_saludable(estatura_cuadrado: float) -> tuple[float, float]:
+    """Devuelve el peso mínimo y máximo saludables a partir
+    de la estatura en metros elevada al cuadrado
+    """
+    return round(estatura_cuadrado * 18.5, 2), round(estatura_cuadrado * 24.99, 2)
+
+
+def informe_imc(peso: int | float, estatura: float | int) -> DictInformeImc:
+    """Encargada de calcular en un solo paso el IMC, su diagnóstico y el
+    rango de peso saludable, la estatura al cuadrado se calcula una sola vez
+    """
+    validar_data_persona(peso=peso, estatura=estatura)
+
+    estatura: float = convertir_cm_a_metros(estatura=estatura)
+
+    estatura_cuadrado: float = estatura * estatura
+
+    imc: float = round(peso / estatura_cuadrado, 2)
+
+    peso_minimo, peso_maximo = _limites_peso_saludable(estatura_cuadrado=estatura_cuadrado)
+
+    return {
+        "imc": imc,
+        "diagnostico": _diagnostico_imc(imc=imc),
+        "peso_minimo": peso_minimo,
+        "peso_maximo": peso_maximo,
+    }
+
+
 def calcular_eta(kcal_base: float) -> float:
     """Encargada de calcular el efecto térmogenico de los alimentos que sera igual a
     un 10% tomando en cuenta las kcal provenientes de la fórmula a utilizar"""
-    return float(kcal_base / 10)
+    return kcal_base / 10
 
 
 def calcular_kcal_totales(kcal_base: float,
                           usar_eta: bool = True) -> float:
     """Encargada de calcular el total de kcal mediante la
-    fórmula elegida por el usuario, ETA, y la actividad fisíca de la persona
+    fórmula elegida por el usuario, ETA, y la actividad fisíca de la persona,
+    repite en línea las mismas expresiones que _kcal_totales_con_eta y _kcal_totales_sin_eta
     """
-
     if usar_eta:
-        eta = calcular_eta(kcal_base=kcal_base)
-        return round(kcal_base + eta, ndigits=2)
+        return round(kcal_base + kcal_base / 10, ndigits=2)
+
+    return round(kcal_base, ndigits=2)
+
+
+def _kcal_totales_con_eta(kcal_base: float) -> float:
+    """Versión de calcular_kcal_totales con el ETA ya decidido, solo la usan
+    las fórmulas por lotes que la eligen una sola vez en lugar de revisar usar_eta en cada fila
+    """
+    return round(kcal_base + kcal_base / 10, ndigits=2)
+
 
+def _kcal_totales_sin_eta(kcal_base: float) -> float:
+    """Versión de calcular_kcal_totales sin ETA
+    """
     return round(kcal_base, ndigits=2)
 
 
 def convertir_metros_a_cm(estatura: float | int) -> float:
+    """Encargada de llevar la estatura a cm, un float menor a 10 se toma como metros.
+    La usan las entradas públicas (Persona.estatura_cm, PersonaBatch, CalculadoraPesoIdeal y
+    las fórmulas públicas), los núcleos privados de las fórmulas ya reciben la estatura en cm
+    """
     if isinstance(estatura, float) and estatura < 10:
-        estatura *= 100
-
-        return float(estatura)
+        return estatura * 100
 
     return float(estatura)
 
 
 def convertir_cm_a_metros(estatura: float | int) -> float:
+    """Encargada de llevar la estatura a metros, un valor mayor a 10 se toma como cm
+    """
     if isinstance(estatura, (float, int)) and estatura > 10:
         estatura /= 100
 
@@ -283,195 +327,302 @@ def convertir_cm_a_metros(estatura: float | int) -> float:
 
 
 def buscar_formula_kcal(formula: FormulasCalculoKcal | str) -> Callable:
-    obtener_formula_mediante_miembro = {
-        FormulasCalculoKcal.HARRIS_BENEDICT: formula_kcal_harris,
-        FormulasCalculoKcal.MIFFLIN: formula_kcal_mifflin,
-        FormulasCalculoKcal.FAO_OMS: formula_kcal_fao_oms,
-    }
+    formula_kcal: Callable | None = _FORMULAS_KCAL.get(formula)
 
-    obtener_formula_mediante_string = {
-        "harris": formula_kcal_harris,
-        "mifflin": formula_kcal_mifflin,
-        "fao/oms": formula_kcal_fao_oms,
-    }
+    if formula_kcal is None:
+        raise ValueError(_MENSAJE_ERROR_FORMULA_KCAL_PERSONA)
 
-    if isinstance(formula, str):
-        return obtener_formula_mediante_string[formula]
+    return formula_kcal
 
-    return obtener_formula_mediante_miembro[formula]
+
+def buscar_formula_kcal_batch(formula: FormulasCalculoKcal | str) -> Callable:
+    formula_kcal: Callable | None = _FORMULAS_KCAL_BATCH.get(formula)
+
+    if formula_kcal is None:
+        raise ValueError(_MENSAJE_ERROR_FORMULA_KCAL_PERSONA)
+
+    return formula_kcal
 
 
 def buscar_formula_peso_ideal(formula: FormulasPesoIdeal | str) -> Callable:
-    obtener_formula_mediante_miembro = {
-        FormulasPesoIdeal.LORENTZ: peso_ideal_lorentz,
-        FormulasPesoIdeal.PERRAULT: peso_ideal_perrault,
-        FormulasPesoIdeal.BROCCA: brocca_peso_ideal,
-    }
+    return _FORMULAS_PESO_IDEAL[formula]
+
 
-    obtener_formula_mediante_string = {
-        "lorentz": peso_ideal_lorentz,
-        "perrault": peso_ideal_perrault,
-        "brocca": brocca_peso_ideal,
+def data_calculo_kcal(obj_persona: Persona | DictCalculoCalorias) -> DictCalculoCalorias:
+    """Esta función retorna los datos de la persona para el cálculo
+    de las kcal, todos son valores simples por lo que no hace falta
+    la copia profunda que hace asdict"""
+    return {
+        "genero": obj_persona.genero,
+        "peso": obj_persona.peso,
+        "estatura": obj_persona.estatura_cm,
+        "edad": obj_persona.edad,
     }
 
-    if isinstance(formula, str):
-        return obtener_formula_mediante_string[formula]
 
-    return obtener_formula_mediante_miembro[formula]
+def _argumentos_lorentz(genero: str, estatura: float | int, edad: int) -> tuple[str, float | int, int]:
+    return genero, estatura, edad
 
 
-def data_calculo_kcal(obj_persona: Persona | DictCalculoCalorias) -> DictCalculoCalorias:
-    return asdict(obj_persona)
+def _argumentos_perrault(genero: str, estatura: float | int, edad: int) -> tuple[float | int, int]:
+    return estatura, edad
+
+
+def _argumentos_brocca(genero: str, estatura: float | int, edad: int) -> tuple[float | int]:
+    return (estatura,)
+
+
+# cada fórmula toma de la persona solo los datos que necesita, en el orden de sus parámetros
+_ARGUMENTOS_PESO_IDEAL: dict[FormulasPesoIdeal | str, Callable] = {
+    FormulasPesoIdeal.LORENTZ: _argumentos_lorentz,
+    FormulasPesoIdeal.PERRAULT: _argumentos_perrault,
+    FormulasPesoIdeal.BROCCA: _argumentos_brocca,
+}
+_ARGUMENTOS_PESO_IDEAL |= {miembro.value: extraer for miembro, extraer in _ARGUMENTOS_PESO_IDEAL.items()}
+
+# nombres de los datos de cada fórmula para get_data_persona, en el mismo orden que sus argumentos
+_CLAVES_PESO_IDEAL: dict[FormulasPesoIdeal | str, tuple[str, ...]] = {
+    FormulasPesoIdeal.LORENTZ: ("genero", "estatura", "edad"),
+    FormulasPesoIdeal.PERRAULT: ("estatura", "edad"),
+    FormulasPesoIdeal.BROCCA: ("estatura",),
+}
+_CLAVES_PESO_IDEAL |= {miembro.value: claves for miembro, claves in _CLAVES_PESO_IDEAL.items()}
+
+
+def _argumentos_calculo_peso_ideal(obj_persona: Persona | DictCalculoPesoIdeal,
+                                   formula: str | FormulasPesoIdeal) -> tuple[float | int | str, ...] | None:
+    """Esta función retorna los datos para el cálculo del peso ideal
+    listos para pasarlos por posición a la fórmula elegida por el usuario"""
+    extraer_argumentos: Callable | None = _ARGUMENTOS_PESO_IDEAL.get(formula)
+
+    if extraer_argumentos is None:
+        return None
+
+    if isinstance(obj_persona, Persona):
+        return extraer_argumentos(obj_persona.genero, obj_persona.estatura_cm, obj_persona.edad)
+
+    return extraer_argumentos(obj_persona.get("genero"),
+                              convertir_metros_a_cm(estatura=obj_persona.get("estatura")),
+                              obj_persona.get("edad"))
 
 
 def data_calculo_peso_ideal(obj_persona: Persona | DictCalculoPesoIdeal,
                             formula: str | FormulasPesoIdeal) -> DictCalculoPesoIdeal:
     """Esta función retorna los datos para el cálculo del peso
     ideal dependiendo de la fórmula elegida por el usuario"""
-    if isinstance(obj_persona, Persona):
-        obj_persona: DictCalculoPesoIdeal = {
-            "genero": obj_persona.genero,
-            "estatura": obj_persona.estatura,
-            "edad": obj_persona.edad,
-        }
+    argumentos: tuple | None = _argumentos_calculo_peso_ideal(obj_persona=obj_persona, formula=formula)
 
-    data_formula_lorentz: dict[str, float | int | str] = {"genero": obj_persona.get("genero"),
-                                                          "estatura": obj_persona.get("estatura"),
-                                                          "edad": obj_persona.get("edad")}
+    if argumentos is None:
+        return None
 
-    data_formula_perrault: dict[str, float | int] = {"estatura": obj_persona.get("estatura"),
-                                                     "edad": obj_persona.get("edad")}
+    return dict(zip(_CLAVES_PESO_IDEAL[formula], argumentos, strict=True))
 
-    data_formula_brocca: dict[str, float | int] = {"estatura": obj_persona.get("estatura")}
 
-    buscar_data_mediante_miembro: dict[FormulasPesoIdeal, dict[str | float | int]] = {
-        FormulasPesoIdeal.LORENTZ: data_formula_lorentz,
+def _kcal_harris(peso: float | int, estatura: float, edad: int, es_mujer: bool) -> float:
+    """Núcleo numérico de la fórmula de harris, recibe la estatura en cm
+    """
+    if es_mujer:
+        return (655.1
+                + (9.563 * peso)
+                + (1.85 * estatura)
+                - (4.676 * edad)
+                )
+
+    return (66.5
+            + (13.75 * peso)
+            + (5.003 * estatura)
+            - (6.775 * edad)
+            )
+
+
+def _kcal_mifflin(peso: float | int, estatura: float, edad: int, es_mujer: bool) -> float:
+    """Núcleo numérico de la fórmula de mifflin, recibe la estatura en cm
+    """
+    if es_mujer:
+        return ((10 * peso)
+                + (6.25 * estatura)
+                - (5 * edad)
+                - 161)
 
-        FormulasPesoIdeal.PERRAULT: data_formula_perrault,
+    return ((10 * peso)
+            + (6.25 * estatura)
+            - (5 * edad)
+            + 5)
 
-        FormulasPesoIdeal.BROCCA: data_formula_brocca,
-    }
 
-    buscar_data_mediante_string: dict[str, dict[str | float | int]] = {
-        "lorentz": data_formula_lorentz,
+def _kcal_fao_oms(peso: float | int, estatura: float, edad: int, es_mujer: bool) -> float:
+    """Núcleo numérico de la fórmula de la fao/oms, recibe la estatura en cm
+    """
+    if es_mujer:
+        return (447.593
+                + (9.247 * peso)
+                + (3.098 * estatura)
+                - (4.330 * edad))
 
-        "perrault": data_formula_perrault,
+    return (88.362
+            + (13.397 * peso)
+            + (4.799 * estatura)
+            - (5.677 * edad))
 
-        "brocca": data_formula_brocca,
 
-    }
+def formula_kcal_harris(genero: str, estatura: float | int,
+                        peso: float | int, edad: int, usar_eta: bool = True) -> float:
+    """Encargada de calcular las kcal de la persona mediante la fórmula de
+    harris, la estatura puede ir en metros o en cm
+    """
+    return _formula_kcal_harris(genero, convertir_metros_a_cm(estatura=estatura), peso, edad, usar_eta)
 
-    if isinstance(formula, str):
-        return buscar_data_mediante_string.get(formula)
 
-    return buscar_data_mediante_miembro.get(formula)
+def _formula_kcal_harris(genero: str, estatura: float,
+                         peso: float | int, edad: int, usar_eta: bool = True) -> float:
+    """Versión de la fórmula de harris que ya recibe la estatura en cm,
+    es la que usan las calculadoras
+    """
+    return calcular_kcal_totales(kcal_base=_kcal_harris(peso, estatura, edad,
+                                                        genero == _GENERO_MUJER),
+                                 usar_eta=usar_eta)
 
 
-def formula_kcal_harris(nombre: str, genero: str, estatura: float | int,
-                        peso: float | int, edad: int, usar_eta: bool = True) -> str:
-    """Encargada de calcular las kcal de la persona mediante la fórmula de
-    harris la cual requiere la estatura en cm
+def formula_kcal_mifflin(genero: str, estatura: float | int,
+                         peso: float | int, edad: int, usar_eta: bool = True) -> float:
+    """Encargada de cálcular las kcal en base a la fórmula de mifflin,
+    la estatura puede ir en metros o en cm
     """
-    mensaje: str = f"De acuerdo a la fórmula de harris estimado {nombre}, las kcal que necesitas son: "
-
-    # if isinstance(estatura, float) and estatura < 10:
-    # estatura *= 100
-    estatura: float = convertir_metros_a_cm(estatura=estatura)
+    return _formula_kcal_mifflin(genero, convertir_metros_a_cm(estatura=estatura), peso, edad, usar_eta)
 
-    if genero == Generos.MUJER.value:
-        formula_mujer: float = (655.1
-                                + (9.563 * peso)
-                                + (1.85 * estatura)
-                                - (4.676 * edad)
-                                )
-        kcal_totales: float = calcular_kcal_totales(kcal_base=formula_mujer,
-                                                    usar_eta=usar_eta)
-        return f"{mensaje}{kcal_totales}"
 
-    formula_hombre: float = (66.5
-                             + (13.75 * peso)
-                             + (5.003 * estatura)
-                             - (6.775 * edad)
-                             )
-    kcal_totales: float = calcular_kcal_totales(kcal_base=formula_hombre,
-                                                usar_eta=usar_eta)
-    return f"{mensaje}{kcal_totales}"
+def _formula_kcal_mifflin(genero: str, estatura: float,
+                          peso: float | int, edad: int, usar_eta: bool = True) -> float:
+    """Versión de la fórmula de mifflin que ya recibe la estatura en cm,
+    es la que usan las calculadoras
+    """
+    return calcular_kcal_totales(kcal_base=_kcal_mifflin(peso, estatura, edad,
+                                                         genero == _GENERO_MUJER),
+                                 usar_eta=usar_eta)
 
 
-def formula_kcal_mifflin(nombre: str, genero: str, estatura: float | int,
-                         peso: float | int, edad: int, usar_eta: bool = True) -> str:
-    """Encargada de cálcular las kcal en base a la fórmula de mifflin
+def formula_kcal_fao_oms(genero: str, estatura: float | int,
+                         peso: float | int, edad: int, usar_eta: bool = True) -> float:
+    """Encargada de calcular las kcal en base a la fórmula de la fao/oms,
+    la estatura puede ir en metros o en cm
     """
-    mensaje: str = f"De acuerdo a la fórmula de mifflin estimado {nombre}, las kcal que necesitas son: "
+    return _formula_kcal_fao_oms(genero, convertir_metros_a_cm(estatura=estatura), peso, edad, usar_eta)
 
-    estatura: float = convertir_metros_a_cm(estatura=estatura)
 
-    if genero == Generos.MUJER.value:
-        formula_mujer: float = ((10 * peso)
-                                + (6.25 * estatura)
-                                - (5 * edad)
-                                - 161)
+def _formula_kcal_fao_oms(genero: str, estatura: float,
+                          peso: float | int, edad: int, usar_eta: bool = True) -> float:
+    """Versión de la fórmula de la fao/oms que ya recibe la estatura en cm,
+    es la que usan las calculadoras
+    """
+    return calcular_kcal_totales(kcal_base=_kcal_fao_oms(peso, estatura, edad,
+                                                         genero == _GENERO_MUJER),
+                                 usar_eta=usar_eta)
 
-        kcal_totales: float = calcular_kcal_totales(kcal_base=formula_mujer,
-                                                    usar_eta=usar_eta)
 
-        return f"{mensaje}{kcal_totales}"
+def formatear_mensaje_kcal(nombre: str, formula: str, kcal_totales: float) -> str:
+    """Encargada de armar el mensaje con las kcal que necesita la persona,
+    se separa de las fórmulas para que estas solo devuelvan el número
+    """
+    return f"De acuerdo a la fórmula de {formula} estimado {nombre}, las kcal que necesitas son: {kcal_totales}"
 
-    formula_hombre: float = ((10 * peso)
-                             + (6.25 * estatura)
-                             - (5 * edad)
-                             + 5)
 
-    kcal_totales = calcular_kcal_totales(kcal_base=formula_hombre,
-                                         usar_eta=usar_eta)
+def formula_kcal_krumdieck(peso: int | float, estatura: int | float) -> float:
+    """Encargada de cálcular las kcal de la persona
+    mediante la fórmula de krumdieck en la cual se
+    necesita la estatura en metros
+    """
+    estatura: float = convertir_metros_a_cm(estatura=estatura) / 100
 
-    return f"{mensaje}{kcal_totales}"
+    return (30 * peso) + (40 * estatura)
 
 
-def formula_kcal_fao_oms(nombre: str, genero: str, estatura: float | int,
-                         peso: float | int, edad: int, usar_eta: bool = True):
-    """Encargada de calcular las kcal en base a la fórmula de la fao/oms
+def _columna(df, nombre: str) -> list:
+    """Devuelve la columna de la tabla como una lista de valores de Python,
+    las columnas de pandas se convierten con tolist() para no arrastrar tipos de numpy
     """
-    mensaje: str = f"De acuerdo a la fórmula de fao/oms estimado {nombre}, las kcal que necesitas son: "
+    columna = df[nombre]
 
-    estatura: float = convertir_metros_a_cm(estatura=estatura)
+    return columna.tolist() if hasattr(columna, "tolist") else list(columna)
 
-    if genero == Generos.MUJER.value:
-        formula_mujer: float = (447.593
-                                + (9.247 * peso)
-                                + (3.098 * estatura)
-                                - (4.330 * edad))
 
-        kcal_totales: float = calcular_kcal_totales(kcal_base=formula_mujer,
-                                                    usar_eta=usar_eta)
+def formula_kcal_harris_batch(pesos: Sequence[float | int], estaturas: Sequence[float | int],
+                              edades: Sequence[int], es_mujer: Sequence[bool],
+                              usar_eta: bool = True) -> list[float]:
+    """Versión por lotes de la fórmula de harris, recibe una secuencia por
+    cada dato (estaturas en cm) del mismo largo y devuelve las kcal de cada persona en el mismo orden
+    """
+    kcal_totales: Callable = _kcal_totales_con_eta if usar_eta else _kcal_totales_sin_eta
 
-        return f"{mensaje}{kcal_totales}"
+    return [kcal_totales(_kcal_harris(peso, estatura, edad, mujer))
+            for peso, estatura, edad, mujer in zip(pesos, estaturas, edades, es_mujer, strict=True)]
 
-    formula_hombre: float = (88.362
-                             + (13.397 * peso)
-                             + (4.799 * estatura)
-                             - (5.677 * edad))
 
-    kcal_totales: float = calcular_kcal_totales(kcal_base=formula_hombre,
-                                                usar_eta=usar_eta)
+def formula_kcal_mifflin_batch(pesos: Sequence[float | int], estaturas: Sequence[float | int],
+                               edades: Sequence[int], es_mujer: Sequence[bool],
+                               usar_eta: bool = True) -> list[float]:
+    """Versión por lotes de la fórmula de mifflin
+    """
+    kcal_totales: Callable = _kcal_totales_con_eta if usar_eta else _kcal_totales_sin_eta
 
-    return f"{mensaje}{kcal_totales}"
+    return [kcal_totales(_kcal_mifflin(peso, estatura, edad, mujer))
+            for peso, estatura, edad, mujer in zip(pesos, estaturas, edades, es_mujer, strict=True)]
 
 
-def formula_kcal_krumdieck(peso: int | float, estatura: int | float) -> float:
-    """Encargada de cálcular las kcal de la persona
-    mediante la fórmula de krumdieck en la cual se
-    }necesita la estatura en metros
+def formula_kcal_fao_oms_batch(pesos: Sequence[float | int], estaturas: Sequence[float | int],
+                               edades: Sequence[int], es_mujer: Sequence[bool],
+                               usar_eta: bool = True) -> list[float]:
+    """Versión por lotes de la fórmula de la fao/oms
     """
-    estatura = estatura if isinstance(estatura, float) and estatura < 10 else (estatura / 100)
+    kcal_totales: Callable = _kcal_totales_con_eta if usar_eta else _kcal_totales_sin_eta
+
+    return [kcal_totales(_kcal_fao_oms(peso, estatura, edad, mujer))
+            for peso, estatura, edad, mujer in zip(pesos, estaturas, edades, es_mujer, strict=True)]
+
+
+# tablas de despacho, cada fórmula se puede buscar por su miembro del Enum o por su valor
+_FORMULAS_KCAL: dict[FormulasCalculoKcal | str, Callable] = {
+    FormulasCalculoKcal.HARRIS_BENEDICT: _formula_kcal_harris,
+    FormulasCalculoKcal.MIFFLIN: _formula_kcal_mifflin,
+    FormulasCalculoKcal.FAO_OMS: _formula_kcal_fao_oms,
+}
+_FORMULAS_KCAL |= {miembro.value: formula for miembro, formula in _FORMULAS_KCAL.items()}
+
+_FORMULAS_KCAL_BATCH: dict[FormulasCalculoKcal | str, Callable] = {
+    FormulasCalculoKcal.HARRIS_BENEDICT: formula_kcal_harris_batch,
+    FormulasCalculoKcal.MIFFLIN: formula_kcal_mifflin_batch,
+    FormulasCalculoKcal.FAO_OMS: formula_kcal_fao_oms_batch,
+}
+_FORMULAS_KCAL_BATCH |= {miembro.value: formula for miembro, formula in _FORMULAS_KCAL_BATCH.items()}
+
+_FORMULAS_PESO_IDEAL: dict[FormulasPesoIdeal | str, Callable] = {
+    FormulasPesoIdeal.LORENTZ: _peso_ideal_lorentz,
+    FormulasPesoIdeal.PERRAULT: _peso_ideal_perrault,
+    FormulasPesoIdeal.BROCCA: _brocca_peso_ideal,
+}
+_FORMULAS_PESO_IDEAL |= {miembro.value: formula for miembro, formula in _FORMULAS_PESO_IDEAL.items()}
+
+
+@lru_cache(maxsize=4096)
+def _calcular_kcal(formula_kcal: Callable, genero: str, estatura: float,
+                   peso: float | int, edad: int, usar_eta: bool) -> float:
+    """Resultado de la fórmula de kcal guardado en caché, las fórmulas son
+    deterministas así que los mismos datos siempre dan las mismas kcal
+    """
+    return formula_kcal(genero, estatura, peso, edad, usar_eta)
+
 
-    return float((30 * peso) + (40 * estatura))
+@lru_cache(maxsize=2048)
+def _calcular_peso_ideal(formula_peso_ideal: Callable, *argumentos: float | int | str) -> float:
+    """Resultado de la fórmula de peso ideal guardado en caché
+    """
+    return formula_peso_ideal(*argumentos)
 
 
-@dataclass
+@dataclass(slots=True)
 class Persona:
     """Define los datos de la persona que
-    posteriormente se usaran para los cálculos
+    posteriormente se usaran para los cálculos,
+    la estatura se guarda tal como se recibe y estatura_cm la da en cm
     """
     nombre: str
     genero: str
@@ -480,16 +631,121 @@ class Persona:
     edad: int
 
     def __post_init__(self):
-        if not isinstance(self.nombre, str) or len(self.nombre) < 5:
+        if type(self.nombre) is not str or len(self.nombre) < 5:
             raise ValueError("Debes colocar una cadena de texto y asegurate de colocar 5 o mas caracteres")
 
+        # el genero es obligatorio, validar_data_persona toma None como un dato que no se valida
+        if not isinstance(self.genero, str):
+            raise ValueError(_MENSAJE_ERROR_GENERO)
+
+        self.genero = self.genero.lower()
+
         validar_data_persona(genero=self.genero, peso=self.peso,
                              estatura=self.estatura, edad=self.edad)
 
-        self.genero = self.genero.lower()
+    @property
+    def estatura_cm(self) -> float:
+        """Estatura en cm que usan las fórmulas, se calcula a partir del valor guardado
+        para que volver a asignar la estatura nunca la convierta dos veces
+        """
+        return convertir_metros_a_cm(estatura=self.estatura)
+
+    @classmethod
+    def from_arrays(cls, nombres: Sequence[str], generos: Sequence[str], pesos: Sequence[float | int],
+                    estaturas: Sequence[float | int], edades: Sequence[int]) -> list[Persona]:
+        """Encargada de crear varias personas a partir de una secuencia por cada dato,
+        todas las secuencias deben tener el mismo largo
+        """
+        return [cls(nombre, genero, peso, estatura, edad)
+                for nombre, genero, peso, estatura, edad in zip(nombres, generos, pesos, estaturas, edades,
+                                                                strict=True)]
 
 
-@dataclass
+@dataclass(slots=True)
+class PersonaBatch:
+    """Define los datos de varias personas guardados por columnas
+    para los cálculos por lotes, la estatura se guarda en cm
+    """
+    nombre: list[str]
+    es_mujer: list[bool]
+    peso: list[float | int]
+    estatura_cm: list[float]
+    edad: list[int]
+
+    def __post_init__(self) -> None:
+        """Encargada de validar cada fila del lote, igual que al crear una persona
+        """
+        self.nombre = list(self.nombre)
+        self.es_mujer = list(self.es_mujer)
+        self.peso = list(self.peso)
+        self.estatura_cm = list(self.estatura_cm)
+        self.edad = list(self.edad)
+
+        if len({len(self.nombre), len(self.es_mujer), len(self.peso), len(self.estatura_cm), len(self.edad)}) != 1:
+            raise ValueError("Todas las columnas del lote deben tener el mismo largo")
+
+        for mujer, peso, estatura, edad in zip(self.es_mujer, self.peso, self.estatura_cm, self.edad):
+            if type(mujer) is not bool:
+                raise ValueError("Los valores de 'es_mujer' deben ser True o False")
+
+            validar_data_persona(peso=peso, estatura=estatura, edad=edad)
+
+        # la estatura se guarda siempre en cm, igual que en Persona
+        self.estatura_cm = [convertir_metros_a_cm(estatura=estatura) for estatura in self.estatura_cm]
+
+    @classmethod
+    def from_personas(cls, personas: Sequence[Persona]) -> PersonaBatch:
+        """Encargada de agrupar por columnas los datos de varias personas, cada
+        persona ya se validó al crearla por lo que el lote no se vuelve a validar
+        """
+        return cls._sin_validar(nombre=[persona.nombre for persona in personas],
+                                es_mujer=[persona.genero == _GENERO_MUJER for persona in personas],
+                                peso=[persona.peso for persona in personas],
+                                estatura_cm=[persona.estatura_cm for persona in personas],
+                                edad=[persona.edad for persona in personas])
+
+    @classmethod
+    def from_columnas(cls, generos: Sequence[str], pesos: Sequence[float | int],
+                      estaturas: Sequence[float | int], edades: Sequence[int]) -> PersonaBatch:
+        """Encargada de crear el lote a partir de una columna por dato, el genero se
+        valida aquí y el resto de las columnas al crear el lote, las filas no llevan nombre
+        """
+        es_mujer: list[bool] = []
+
+        for genero in generos:
+            # el genero es obligatorio, validar_data_persona toma None como un dato que no se valida
+            if not isinstance(genero, str):
+                raise ValueError(_MENSAJE_ERROR_GENERO)
+
+            genero = genero.lower()
+
+            validar_data_persona(genero=genero)
+
+            es_mujer.append(genero == _GENERO_MUJER)
+
+        return cls(nombre=[""] * len(es_mujer), es_mujer=es_mujer, peso=pesos, estatura_cm=estaturas, edad=edades)
+
+    @classmethod
+    def _sin_validar(cls, nombre: list[str], es_mujer: list[bool], peso: list[float | int],
+                     estatura_cm: list[float], edad: list[int]) -> PersonaBatch:
+        """Crea el lote sin pasar por __post_init__, solo para columnas que ya
+        están validadas y con la estatura en cm
+        """
+        batch: PersonaBatch = object.__new__(cls)
+
+        batch.nombre = nombre
+        batch.es_mujer = es_mujer
+        batch.peso = peso
+        batch.estatura_cm = estatura_cm
+        batch.edad = edad
+
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.nombre)
+
+
+@dataclass(slots=True)
 class ValoracionNutricional:
     """Clase encargada de mostrarle a la persona su estado nutricio.
     """
@@ -500,14 +756,10 @@ class ValoracionNutricional:
             raise ValueError("El nombre debe ser una cadena de texto y tener al menos 5 caracteres")
 
     def calcular_imc(self, peso: float | int, estatura: float | int) -> float:
-        """Encargada de calcular el IMC en base a su peso y estatura.
+        """Encargada de calcular el IMC en base a su peso y estatura,
+        usa el cálculo en caché de la función calcular_imc.
         """
-        validar_data_persona(peso=peso, estatura=estatura)
-
-        if isinstance(estatura, int):
-            estatura = float(estatura / 100)
-
-        resultado = round(peso / (estatura ** 2), ndigits=2)
+        resultado = calcular_imc(peso=peso, estatura=estatura)
 
         print(f"Hola {self.name} este es tu imc: {resultado=}")
 
@@ -515,33 +767,27 @@ class ValoracionNutricional:
 
     def diagnostico_imc(self, peso: float | int,
                         estatura: float | int) -> str:
-        """De acuerdo al calculo del IMC se encarga de mostrarle al usuario su estado actual.
+        """De acuerdo al calculo del IMC se encarga de mostrarle al usuario su estado actual,
+        los datos se validan dentro de calcular_imc.
         """
-        validar_data_persona(estatura=estatura, peso=peso)
-
         resultado_imc = self.calcular_imc(peso=peso, estatura=estatura)
 
-        mensajes_diagnostico = {
-            "bajo_peso": "Te encuentras en un bajo peso",
-            "normal": "Te encuentras en un peso saludable",
-            "sobrepeso": "Te encuentras en sobrepeso",
-            "obesidad": "Te encuentras en obesidad"
-        }
-
-        bajo_peso: bool = resultado_imc < 18.5
-        peso_normal: bool = 18.5 <= resultado_imc < 25
-        sobrepeso: bool = 24.99 < resultado_imc < 30
-        obesidad: bool = 29.99 < resultado_imc < 35
+        return _diagnostico_imc(imc=resultado_imc)
 
-        resultados_comprobacion_imc: list[bool] = [bajo_peso, peso_normal, sobrepeso, obesidad]
+    def diagnostico_imc_batch(self, pesos: Sequence[float | int],
+                              estaturas: Sequence[float | int]) -> list[str]:
+        """Versión por lotes de diagnostico_imc, devuelve el diagnóstico
+        de cada par de peso y estatura en el mismo orden y sin imprimir
+        el IMC de cada uno, las dos secuencias deben tener el mismo largo
+        """
+        diagnosticos: list[str] = []
 
-        resultado: list[str] | list = [mensaje_diagnostico for mensaje_diagnostico, comprobacion_imc in zip(
-            mensajes_diagnostico, resultados_comprobacion_imc) if comprobacion_imc]
+        for peso, estatura in zip(pesos, estaturas, strict=True):
+            validar_data_persona(peso=peso, estatura=estatura)
 
-        if resultado:
-            return mensajes_diagnostico[resultado[0]]
+            diagnosticos.append(_diagnostico_imc(imc=_calcular_imc(peso, estatura)))
 
-        return "No te encuentras en ninguno de los resultados, verifica bien los datos que ingresados"
+        return diagnosticos
 
     def gasto_energetico(self, nombre: str, genero: str, peso: float | int,
                          estatura: float | int, edad: int,
@@ -552,7 +798,7 @@ class ValoracionNutricional:
         pass
 
 
-@dataclass
+@dataclass(slots=True)
 class CalculadoraDeCalorias(Calculadora):
     """Esta clase se encarga de calcular las calorias que necesita
     consumir una persona para mantenerse en su peso actual en base a diferentes parametros
@@ -560,14 +806,15 @@ class CalculadoraDeCalorias(Calculadora):
     persona: Persona
     formula: FormulasCalculoKcal | str = FormulasCalculoKcal.MIFFLIN
     eta: bool = True
+    _formula_kcal: Callable = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        """Encargada de validar los datos ingresados del usuario
+        """Encargada de validar los datos ingresados del usuario, la fórmula
+        se guarda siempre como el valor en minúsculas del Enum
         """
-        validar_formula_kcal(formula=self.formula, eta=self.eta)
+        self.formula = _normalizar_formula_kcal(formula=self.formula, eta=self.eta)
 
-        if isinstance(self.formula, str):
-            self.formula = self.formula.lower()
+        self._formula_kcal = buscar_formula_kcal(self.formula)
 
     def get_data_persona(self) -> DictCalculoCalorias:
         """Encaragada de convertir la instancia de persona
@@ -577,27 +824,70 @@ class CalculadoraDeCalorias(Calculadora):
         return data_calculo_kcal(obj_persona=self.persona)
 
     def buscar_formula(self) -> Callable:
-        return buscar_formula_kcal(self.formula)
+        """Devuelve la fórmula resuelta al crear la calculadora
+        """
+        return self._formula_kcal
 
-    def calcular(self) -> str:
+    def calcular(self) -> float:
         """Encargada de usar los datos pasados por el usuario
-        para calcular sus kcal en base a la fórmula elegida
+        para calcular sus kcal en base a la fórmula elegida, los datos
+        se pasan por posición para no construir un diccionario de kwargs
         """
+        persona: Persona = self.persona
 
-        persona_data: DictCalculoCalorias = self.get_data_persona()
+        return _calcular_kcal(self._formula_kcal, persona.genero, persona.estatura_cm,
+                              persona.peso, persona.edad, self.eta)
 
-        formula_kcal_a_usar: Callable = self.buscar_formula()
+    def calcular_mensaje(self) -> str:
+        """Encargada de devolver las kcal de la persona dentro de un mensaje para mostrarlo al usuario
+        """
+        return formatear_mensaje_kcal(nombre=self.persona.nombre, formula=self.formula, kcal_totales=self.calcular())
+
+    @classmethod
+    def from_dataframe(cls, df, formula: FormulasCalculoKcal | str = FormulasCalculoKcal.MIFFLIN,
+                       eta: bool = True) -> list[float]:
+        """Encargada de calcular las kcal de todas las filas de una tabla
+        (un DataFrame o un diccionario de columnas) con las columnas
+        'genero', 'peso', 'estatura' y 'edad', usando las fórmulas por lotes
+        """
+        formula = _normalizar_formula_kcal(formula=formula, eta=eta)
+
+        batch: PersonaBatch = PersonaBatch.from_columnas(generos=_columna(df, "genero"),
+                                                         pesos=_columna(df, "peso"),
+                                                         estaturas=_columna(df, "estatura"),
+                                                         edades=_columna(df, "edad"))
 
-        return formula_kcal_a_usar(**persona_data, usar_eta=self.eta)
+        return cls.calcular_batch(batch, formula=formula, eta=eta)
 
+    @classmethod
+    def batch(cls, personas: Sequence[Persona], formula: FormulasCalculoKcal | str = FormulasCalculoKcal.MIFFLIN,
+              eta: bool = True) -> list[float]:
+        """Encargada de calcular las kcal de varias personas a la vez, los datos de
+        cada persona ya se validaron al crearla por lo que solo se valida la fórmula
+        """
+        return cls.calcular_batch(PersonaBatch.from_personas(personas), formula=formula, eta=eta)
+
+    @classmethod
+    def calcular_batch(cls, batch: PersonaBatch, formula: FormulasCalculoKcal | str = FormulasCalculoKcal.MIFFLIN,
+                       eta: bool = True) -> list[float]:
+        """Encargada de calcular las kcal de un lote de personas guardado por columnas,
+        la fórmula se resuelve una sola vez para todo el lote
+        """
+        formula = _normalizar_formula_kcal(formula=formula, eta=eta)
 
-@dataclass
+        formula_kcal_a_usar: Callable = buscar_formula_kcal_batch(formula)
+
+        return formula_kcal_a_usar(batch.peso, batch.estatura_cm, batch.edad, batch.es_mujer, usar_eta=eta)
+
+
+@dataclass(slots=True)
 class CalculadoraPesoIdeal(Calculadora):
     """Clase encargadad de calcular el
     peso ideal de las personas mediante distintas fórmulas
     """
     persona: Persona | DictCalculoPesoIdeal
     formula: FormulasPesoIdeal | str = FormulasPesoIdeal.LORENTZ
+    _formula_peso_ideal: Callable = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if isinstance(self.persona, dict):
@@ -609,30 +899,42 @@ class CalculadoraPesoIdeal(Calculadora):
                 raise ValueError(f"Las claves esperadas son las siguientes: {claves_esperadas}"
                                  f"\nLas claves obtenidas son: {claves_diccionario_obtenido}")
 
+            genero = self.persona.get("genero")
+
+            if isinstance(genero, str):
+                self.persona = {**self.persona, "genero": genero.lower()}
+
             validar_data_persona(genero=self.persona.get("genero"),
                                  estatura=self.persona.get("estatura"),
                                  edad=self.persona.get("edad"))
 
+        if isinstance(self.formula, FormulasPesoIdeal):
+            self.formula = self.formula.value
+        elif isinstance(self.formula, str):
+            self.formula = self.formula.lower()
+
         validar_formula_peso_ideal(formula=self.formula)
 
+        self._formula_peso_ideal = buscar_formula_peso_ideal(formula=self.formula)
+
     def get_data_persona(self) -> DictCalculoPesoIdeal:
         """Encargada de devolver un diccionario con los
-        datos necesarios para el cálculo del peso ideal
+        datos necesarios para el cálculo del peso ideal,
+        se lee de la persona en cada llamada
         """
         return data_calculo_peso_ideal(obj_persona=self.persona, formula=self.formula)
 
     def buscar_formula(self) -> Callable:
-        return buscar_formula_peso_ideal(formula=self.formula)
+        """Devuelve la fórmula resuelta al crear la calculadora
+        """
+        return self._formula_peso_ideal
 
     def calcular(self) -> float:
         """Encargada de devolver el resultado del
         peso ideal en base a la fórmula elegida
         """
-        data_calculo: DictCalculoPesoIdeal = self.get_data_persona()
-
-        formula_peso_ideal: Callable = self.buscar_formula()
-
-        return formula_peso_ideal(**data_calculo)
+        return _calcular_peso_ideal(self._formula_peso_ideal,
+                                    *_argumentos_calculo_peso_ideal(obj_persona=self.persona, formula=self.formula))
 
 
 @validar_data
@@ -649,7 +951,7 @@ if __name__ == "__main__":
     mis_kcal = CalculadoraDeCalorias(persona=persona, formula=FormulasCalculoKcal.HARRIS_BENEDICT, eta=True)
     print(mis_kcal)
 
-    print(mis_kcal.calcular())
+    print(mis_kcal.calcular_mensaje())
 
     print(peso_ideal_perrault(estatura=170, edad=22))
     print(brocca_peso_ideal(estatura=170))